@@ -1,16 +1,197 @@
 import sys
 import binascii
-import cbor2
 import io
+import mmap
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QFileDialog, QTreeWidget, QTreeWidgetItem,
+    QApplication, QMainWindow, QFileDialog, QTreeView,
     QLabel, QVBoxLayout, QWidget, QScrollArea, QMessageBox, QInputDialog,
     QSplitter, QStatusBar, QTabWidget, QAction, QTextEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
 from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon
 from PIL import Image
 
+# Older cbor2 releases ship the C accelerated codec as a separate _cbor2 module
+try:
+    from _cbor2 import loads as cbor_loads, CBOREncoder
+except ImportError:
+    from cbor2 import loads as cbor_loads, CBOREncoder
+
+# Strings accepted as True when editing a bool value
+_TRUE_TOKENS = frozenset({'true', '1', 'yes', 'y'})
+
+class LazyImage:
+    """A JPEG embedded in a byte string, only decoded the first time it is shown."""
+
+    # Large screenshots are scaled down to this before being turned into a pixmap
+    MAX_SIZE = (1920, 1080)
+
+    __slots__ = ("data", "start", "end", "_pixmap")
+
+    def __init__(self, data, start, end):
+        self.data = data
+        self.start = start
+        self.end = end
+        self._pixmap = None
+
+    def pixmap(self):
+        if self._pixmap is None:
+            image = Image.open(io.BytesIO(self.data[self.start:self.end]))
+            image.thumbnail(self.MAX_SIZE)
+            self._pixmap = pil_image_to_qt_pixmap(image)
+        return self._pixmap
+
+class CBORTreeNode:
+    """A single row of the tree, addressed by (parent_container, key).
+
+    images is the table built by scan_for_images; byte strings listed in it
+    get one child row per embedded JPEG.
+    """
+
+    __slots__ = ("parent", "row", "container", "key", "label", "path", "images", "is_image", "_children")
+
+    def __init__(self, parent, row, container, key, label, images, is_image=False):
+        self.parent = parent
+        self.row = row
+        self.container = container
+        self.key = key
+        self.label = label
+        self.path = parent.path + (label,) if parent is not None else ()  # Labels from the top level down
+        self.images = images
+        self.is_image = is_image
+        self._children = None
+
+    @property
+    def value(self):
+        return self.container[self.key]
+
+    def has_children(self):
+        if self.is_image:
+            return False
+        value = self.value
+        if isinstance(value, (dict, list)):
+            return len(value) > 0
+        return isinstance(value, bytes) and id(value) in self.images
+
+    def children(self):
+        """Create the child rows of this node the first time they are asked for."""
+        if self._children is None:
+            value = self.value
+            if self.is_image:
+                self._children = []
+            elif isinstance(value, dict):
+                self._children = [
+                    CBORTreeNode(self, row, value, key, key.hex() if isinstance(key, bytes) else str(key), self.images)
+                    for row, key in enumerate(value)
+                ]
+            elif isinstance(value, list):
+                self._children = [
+                    CBORTreeNode(self, index, value, index, f"[{index}]", self.images)
+                    for index in range(len(value))
+                ]
+            elif isinstance(value, bytes) and id(value) in self.images:
+                images = self.images[id(value)]
+                self._children = [
+                    CBORTreeNode(self, index, images, index, f"Image {index}", self.images, is_image=True)
+                    for index in range(len(images))
+                ]
+            else:
+                self._children = []
+        return self._children
+
+    def display_value(self):
+        if self.is_image:
+            return "Double-click to view"
+        value = self.value
+        if isinstance(value, (dict, list)):
+            return ""
+        if isinstance(value, bytes):
+            # Only hexlified once the row is actually on screen
+            return "" if id(value) in self.images else binascii.hexlify(value).decode('utf-8')
+        return str(value)
+
+class CBORTreeModel(QAbstractItemModel):
+    """Tree model over the decoded CBOR data.
+
+    Rows are only created when the view expands their parent, so opening a
+    save costs O(visible rows) instead of O(total nodes).
+    """
+
+    HEADERS = ("Key", "Value")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = CBORTreeNode(None, 0, [None], 0, "", {})
+
+    def setRoot(self, data, images):
+        """Show data, with images being the table scan_for_images built for it."""
+        self.beginResetModel()
+        self._root = CBORTreeNode(None, 0, [data], 0, "", images)
+        self.endResetModel()
+
+    def node(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children()[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children())
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return False
+        return self.node(parent).has_children()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.label if index.column() == 0 else node.display_value()
+        if role == Qt.UserRole and node.is_image:
+            return node.value
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store a new value for a row, dropping any children it had."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        node = index.internalPointer()
+        index = self.createIndex(node.row, 0, node)
+        if node._children:
+            self.beginRemoveRows(index, 0, len(node._children) - 1)
+            node.container[node.key] = value
+            node._children = None
+            self.endRemoveRows()
+        else:
+            node.container[node.key] = value
+            node._children = None
+        self.dataChanged.emit(index, self.createIndex(node.row, 1, node))
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
 class CBORViewerApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -20,10 +201,10 @@ class CBORViewerApp(QMainWindow):
         # Set your custom icon here (ensure you have the path to the icon)
         self.setWindowIcon(QIcon(r"C:\Users\jakee\Documents\ouput\icon.ico"))
 
-        self.original_data = None
         self.cbor_data = None
-        self.human_readable_data = None
-        self.changes = {}  # Track all changes here
+        self.cbor_offsets = None  # Key path -> (start, length) of each item in dump_data, built on first edit
+        self._images = {}  # id() of a byte string in cbor_data -> LazyImages embedded in it
+        self.changes = {}  # (id(container), key) -> ((start, length) in dump_data, new typed value)
         self.current_file_path = None
 
         self.init_ui()
@@ -36,10 +217,16 @@ class CBORViewerApp(QMainWindow):
 
         splitter = QSplitter(Qt.Horizontal)
 
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Key", "Value"])
-        self.tree.itemClicked.connect(self.on_item_clicked)
-        self.tree.itemDoubleClicked.connect(self.on_item_double_click)
+        self.model = CBORTreeModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        # Every row is one line of text, so skip per-row height measuring and
+        # the expand animation and autoscroll bookkeeping
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
+        self.tree.setAutoScroll(False)
+        self.tree.clicked.connect(self.on_item_clicked)
+        self.tree.doubleClicked.connect(self.on_item_double_click)
         splitter.addWidget(self.tree)
 
         tabs = QTabWidget()
@@ -55,6 +242,14 @@ class CBORViewerApp(QMainWindow):
         self.detail_view.setReadOnly(True)
         tabs.addTab(self.detail_view, "Details")
 
+        # Filled in only when the tab is opened, see on_tab_changed
+        self.hex_view = QTextEdit()
+        self.hex_view.setReadOnly(True)
+        self.hex_view.setFont(QFont('Courier New', 10))
+        tabs.addTab(self.hex_view, "Hex View")
+        tabs.currentChanged.connect(self.on_tab_changed)
+        self.tabs = tabs
+
         splitter.addWidget(tabs)
 
         layout.addWidget(splitter)
@@ -80,7 +275,7 @@ class CBORViewerApp(QMainWindow):
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                                             stop:0 #2e2e2e, stop:1 #1e1e1e);
             }
-            QTreeWidget {
+            QTreeView {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                                             stop:0 #3a3a3a, stop:1 #2b2b2b);
                 color: #e0e0e0;
@@ -88,10 +283,10 @@ class CBORViewerApp(QMainWindow):
                 font-family: 'Verdana';
                 font-size: 12pt;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 color: #e0e0e0;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #00cc66;
                 color: #000000;
             }
@@ -145,64 +340,67 @@ class CBORViewerApp(QMainWindow):
             if not file_path:
                 return
 
-            self.current_file_path = file_path  # Store the current file path
-
-            with open(file_path, 'rb') as f:
-                self.original_data = f.read()
-
-            _, _, self.split_data, self.dump_data = read_and_split_sav_file(file_path)
-            self.cbor_data = parse_cbor_dump(self.dump_data)
+            # Load into locals first, so a file that fails to parse leaves the current one untouched
+            split_data, dump_data = read_and_split_sav_file(file_path)
+            cbor_data = parse_cbor_dump(dump_data)
 
-            if not self.cbor_data:
+            if not cbor_data:
                 QMessageBox.critical(self, "Error", "Failed to parse CBOR data.")
                 return
 
-            self.human_readable_data = make_human_readable(self.cbor_data)
-            self.populate_tree(self.human_readable_data)
+            images = {}
+            scan_for_images(cbor_data, images)
+
+            self.current_file_path = file_path  # Store the current file path
+            self.changes.clear()  # Pending edits belong to the previous file
+            self.split_data, self.dump_data = split_data, dump_data
+            self.cbor_data = cbor_data
+            self.cbor_offsets = None
+            self._images = images
+            self.populate_tree(self.cbor_data, self._images)
+            self.refresh_hex_view()
             self.status_bar.showMessage("File loaded successfully.", 5000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
             self.status_bar.showMessage("Failed to load file.", 5000)
 
-    def populate_tree(self, data, parent=None):
-        if parent is None:
-            self.tree.clear()
-            parent = self.tree.invisibleRootItem()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                item = QTreeWidgetItem([str(key), ""])
-                parent.addChild(item)
-                self.populate_tree(value, item)
-        elif isinstance(data, list):
-            for index, value in enumerate(data):
-                item = QTreeWidgetItem([f"[{index}]", ""])
-                parent.addChild(item)
-                self.populate_tree(value, item)
-        else:
-            if isinstance(data, QPixmap):
-                item = QTreeWidgetItem([f"Image {parent.childCount()}", "Double-click to view"])
-                item.setData(0, Qt.UserRole, data)
-                parent.addChild(item)
-            else:
-                parent.setText(1, str(data))
+    def populate_tree(self, data, images):
+        """Swap the model root in one reset, with view repaints held off until it is done."""
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.model.setRoot(data, images)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def refresh_hex_view(self):
+        """Drop the hex view of the previous file contents, rebuilding it only if it is on screen."""
+        self.hex_view.clear()
+        self.on_tab_changed(self.tabs.currentIndex())
+
+    def on_tab_changed(self, tab_index):
+        """Build the hex view the first time it is shown for the current file."""
+        if self.tabs.widget(tab_index) is not self.hex_view:
+            return
+        if self.current_file_path and self.hex_view.document().isEmpty():
+            try:
+                with open(self.current_file_path, 'rb') as f:
+                    self.hex_view.setPlainText(compute_hex_view(f.read()))
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to load hex view: {e}")
+                self.status_bar.showMessage("Failed to load hex view.", 5000)
 
-    def on_item_clicked(self, item, column):
+    def on_item_clicked(self, index):
         """Show details when an item is clicked."""
-        if item:  # Ensure the item is valid
-            if not isinstance(item.data(0, Qt.UserRole), QPixmap):
-                details = self.get_detailed_information(item)
+        if index.isValid():  # Ensure the index is valid
+            if not isinstance(index.data(Qt.UserRole), LazyImage):
+                details = self.get_detailed_information(index)
                 self.detail_view.setText(details)
 
-    def get_detailed_information(self, item):
+    def get_detailed_information(self, index):
         """Retrieve detailed information for the selected item."""
-        keys = []
-        while item is not None:
-            keys.append(item.text(0))
-            item = item.parent()
-        keys = list(reversed(keys))
+        keys = self.model.node(index).path
 
-        value = self.get_value(self.cbor_data, keys)
+        value = self.get_value(index)
         value_type = type(value).__name__
         details = f"Key Path: {' > '.join(keys)}\nValue: {value}\nType: {value_type}"
 
@@ -211,56 +409,65 @@ class CBORViewerApp(QMainWindow):
 
         return details
 
-    def on_item_double_click(self, item, column):
+    def on_item_double_click(self, index):
         """Handle double-clicks to edit or view items."""
-        if item:  # Ensure the item is valid
-            if isinstance(item.data(0, Qt.UserRole), QPixmap):
-                pixmap = item.data(0, Qt.UserRole)
+        if index.isValid():  # Ensure the index is valid
+            if isinstance(index.data(Qt.UserRole), LazyImage):
+                try:
+                    pixmap = index.data(Qt.UserRole).pixmap()
+                except Exception as e:
+                    self.status_bar.showMessage(f"Image could not be displayed: {e}", 5000)
+                    return
                 self.image_label.setPixmap(pixmap)
                 self.status_bar.showMessage("Image displayed.", 5000)
             else:
-                current_value = item.text(1)
-                current_details = self.get_detailed_information(item)
+                value_index = index.sibling(index.row(), 1)
+                current_value = value_index.data()
+                current_details = self.get_detailed_information(index)
                 value_type = current_details.split('Type: ')[1].strip()
                 new_value, ok = QInputDialog.getText(self, "Edit Value", f"New Value (Type: {value_type}):", text=current_value)
                 if ok and new_value != current_value:
-                    item.setText(1, new_value)
-                    self.update_cbor_data(item, new_value, value_type)
-                    self.status_bar.showMessage("Value updated.", 5000)
-
-    def get_value(self, d, keys):
-        """Retrieve value from nested dictionary using a list of keys."""
-        for key in keys:
-            if key.startswith("[") and key.endswith("]"):
-                d = d[int(key[1:-1])]
-            else:
-                d = d[key]
-        return d
-
-    def update_cbor_data(self, item, new_value, value_type):
-        if item:  # Ensure the item is valid
-            keys = []
-            while item is not None:
-                keys.append(item.text(0))
-                item = item.parent()
-            keys = list(reversed(keys))
-
-            def set_value(d, keys, value):
-                for key in keys[:-1]:
-                    if key.startswith("[") and key.endswith("]"):
-                        d = d[int(key[1:-1])]
-                    else:
-                        d = d[key]
-
-                if keys[-1].startswith("[") and keys[-1].endswith("]"):
-                    original_value = d[int(keys[-1][1:-1])]
-                    d[int(keys[-1][1:-1])] = self.cast_to_correct_type(value, value_type)
-                else:
-                    original_value = d[keys[-1]]
-                    d[keys[-1]] = self.cast_to_correct_type(value, value_type)
-
-            self.changes[tuple(keys)] = {"original": self.get_value(self.cbor_data, keys), "new": new_value, "type": value_type}
-            set_value(self.cbor_data, keys, new_value)
+                    if self.update_cbor_data(index, new_value, value_type):
+                        self.status_bar.showMessage("Value updated.", 5000)
+
+    def get_value(self, index):
+        """Retrieve the CBOR value behind an item."""
+        return self.model.node(index).value
+
+    def set_value(self, index, value):
+        """Store value in the CBOR data behind an item and refresh its row."""
+        self.model.setData(index, value)
+
+    def update_cbor_data(self, index, new_value, value_type):
+        """Apply an edit and queue it for saving, returning whether it was applied."""
+        node = self.model.node(index)
+        if not index.isValid() or node.is_image:
+            return False
+        change_key = (id(node.container), node.key)
+        typed_value = self.cast_to_correct_type(new_value, value_type)
+        offset = self.get_offset(self.get_key_path(index))
+        if offset is None:
+            QMessageBox.warning(self, "Edit Not Applied",
+                                "The location of this value in the save file could not be found, so it cannot be saved.")
+            return False
+
+        # Pending edits are spliced in by their original spans, so those spans must not nest
+        start, length = offset
+        inner = []
+        for key, ((other_start, other_length), _) in self.changes.items():
+            if key == change_key:
+                continue
+            if start <= other_start and other_start + other_length <= start + length:
+                inner.append(key)
+            elif other_start <= start and start + length <= other_start + other_length:
+                QMessageBox.warning(self, "Edit Not Applied",
+                                    "This value is inside one that has already been edited. Save first, then edit it.")
+                return False
+        for key in inner:
+            del self.changes[key]  # Replaced along with the container being edited
+        self.changes[change_key] = (offset, typed_value)
+        self.set_value(index, typed_value)
+        return True
 
     def cast_to_correct_type(self, value, value_type):
         try:
@@ -269,7 +476,7 @@ class CBORViewerApp(QMainWindow):
             elif value_type == 'float':
                 return float(value)
             elif value_type == 'bool':
-                return value.lower() in ['true', '1']
+                return value.lower() in _TRUE_TOKENS
             else:
                 return str(value)
         except ValueError:
@@ -281,67 +488,94 @@ class CBORViewerApp(QMainWindow):
                 QMessageBox.information(self, "No Changes", "No user-made changes to save.")
                 return
 
-            # Open the original file data
-            with open(self.current_file_path, 'rb') as f:
-                original_file_data = f.read()
-
-            # Apply only the changes from self.changes dictionary
-            for keys, change in self.changes.items():
-                original_value = change["original"]
-                new_value = change["new"]
-                value_type = change["type"]
+            # Encode each change for the spot its original value occupies in the dump
+            edits = []
+            stream = io.BytesIO()
+            encoder = CBOREncoder(stream)
+            for (start, length), new_value in self.changes.values():
+                stream.seek(0)
+                stream.truncate()
+                encoder.encode(new_value)
+                new_bytes = stream.getvalue()
+                edits.append((start + 26, length, new_bytes))
+
+            if all(len(new_bytes) == length for _, length, new_bytes in edits):
+                # Nothing moves, so patch the changed bytes straight into the mapped file;
+                # the dump size and every recorded offset stay as they are
+                with open(self.current_file_path, 'r+b') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE) as mm:
+                    for start, length, new_bytes in edits:
+                        mm[start:start + length] = new_bytes
+                    mm.flush()
+                    self.dump_data = mm[26:-1]
+            else:
+                # Open the original file data
+                with open(self.current_file_path, 'rb') as f:
+                    original_file_data = bytearray(f.read())
 
-                original_bytes = cbor2.dumps(original_value)
-                new_bytes = cbor2.dumps(self.cast_to_correct_type(new_value, value_type))
+                # Splice from the back of the file forward so earlier offsets stay valid
+                for start, length, new_bytes in sorted(edits, reverse=True):
+                    original_file_data[start:start + length] = new_bytes
 
-                index = original_file_data.find(original_bytes)
+                # Update dump size (recalculate based on modified data)
+                new_dump_size = len(original_file_data) - 27  # Size of the CBOR section between the header and the last byte
+                new_dump_size_hex = f'{new_dump_size:08x}'.encode('ascii')  # Convert to hex and encode to ASCII
 
-                if index != -1:
-                    original_file_data = original_file_data[:index] + new_bytes + original_file_data[index + len(original_bytes):]
+                # Write the updated dump size over the old one, right after the signature
+                original_file_data[8:16] = new_dump_size_hex
 
-            # Update dump size (recalculate based on modified data)
-            new_cbor_data = original_file_data[26:-1]  # The new CBOR data section
-            new_dump_size = len(new_cbor_data)  # Calculate the new dump size based on CBOR section
-            new_dump_size_hex = f'{new_dump_size:08x}'.encode('ascii')  # Convert to hex and encode to ASCII
+                # Write the updated data back to the file
+                with open(self.current_file_path, 'wb') as f:
+                    f.write(original_file_data)
 
-            # Rebuild the original data with updated dump size
-            original_file_data = (
-                original_file_data[:8]  # Signature part
-                + new_dump_size_hex  # Updated dump size
-                + original_file_data[16:]  # Rest of the file
-            )
+                # The old offsets no longer describe the file
+                self.dump_data = bytes(memoryview(original_file_data)[26:-1])
+                self.cbor_offsets = None
 
-            # Write the updated data back to the file
-            with open(self.current_file_path, 'wb') as f:
-                f.write(original_file_data)
+            self.changes.clear()  # Every change is in the file now
 
             self.status_bar.showMessage("Changes saved successfully.", 5000)
             QMessageBox.information(self, "Success", "Data successfully saved to file.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save changes: {e}")
             self.status_bar.showMessage("Failed to save changes.", 5000)
+            return
 
-    def get_item_path(self, item):
-        """Retrieve the path of keys to the current item."""
-        keys = []
-        while item is not None:
-            keys.append(item.text(0))
-            item = item.parent()
-        return list(reversed(keys))
+        # Kept out of the save's try, since the file is already written by now
+        self.refresh_hex_view()
 
-def read_and_split_sav_file(file_path):
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    def get_offset(self, key_path):
+        """Return the (start, length) of the item at key_path in dump_data, or None.
+
+        Indexing walks every item in the dump, which costs more than decoding
+        it, so it is put off until the first edit rather than done on open.
+        """
+        if self.cbor_offsets is None:
+            self.cbor_offsets = index_cbor_offsets(self.dump_data)
+        return self.cbor_offsets.get(key_path)
+
+    def get_key_path(self, index):
+        """Retrieve the actual dict keys and list indices leading to the current item."""
+        keys = []
+        node = self.model.node(index)
+        while node.parent is not None:
+            keys.append(node.key)
+            node = node.parent
+        return tuple(reversed(keys))
 
-    hex_dump, ascii_dump = hex_ascii_display(data)
+    def get_item_path(self, index):
+        """Retrieve the path of keys to the current item."""
+        return list(self.model.node(index).path)
 
-    signature = data[:8]
-    ascii_dump_size = data[8:16]
-    separator_1 = data[16:17]
-    ascii_unk = data[17:25]
-    separator_2 = data[25:26]
-    dump_data = data[26:-1]
-    separator_3 = data[-1:]
+def read_and_split_sav_file(file_path):
+    # Map the file rather than reading it, so only the slices below get copied
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        signature = data[:8]
+        ascii_dump_size = data[8:16]
+        separator_1 = data[16:17]
+        ascii_unk = data[17:25]
+        separator_2 = data[25:26]
+        dump_data = data[26:-1]
+        separator_3 = data[-1:]
 
     split_data = {
         "Signature": signature.hex(),
@@ -353,65 +587,139 @@ def read_and_split_sav_file(file_path):
         "Separator 3": separator_3.hex()
     }
 
-    return hex_dump, ascii_dump, split_data, dump_data
+    return split_data, dump_data
 
 def parse_cbor_dump(dump_data):
     try:
-        cbor_data = cbor2.loads(dump_data)
+        cbor_data = cbor_loads(dump_data)
         return cbor_data
     except Exception as e:
         print(f"Error parsing CBOR data: {e}")
         return None
 
+def _read_cbor_head(data, pos):
+    """Read an item's initial byte and argument, returning (major type, argument, next position)."""
+    initial = data[pos]
+    major, info = initial >> 5, initial & 0x1f
+    pos += 1
+    if info < 24:
+        return major, info, pos
+    if info == 31:
+        return major, None, pos  # Indefinite length
+    if info > 27:
+        raise ValueError(f"Invalid CBOR additional info {info} at offset {pos - 1}")
+    size = 1 << (info - 24)
+    return major, int.from_bytes(data[pos:pos + size], 'big'), pos + size
+
+def _index_cbor_item(data, pos, path, offsets):
+    """Walk the item at pos, recording (start, length) for it and its children under their key paths."""
+    start = pos
+    major, arg, pos = _read_cbor_head(data, pos)
+    if major in (2, 3):  # Byte and text strings
+        if arg is None:
+            while data[pos] != 0xff:
+                _, chunk_length, pos = _read_cbor_head(data, pos)
+                pos += chunk_length
+            pos += 1
+        else:
+            pos += arg
+    elif major == 4:  # Arrays
+        index = 0
+        while (index < arg) if arg is not None else (data[pos] != 0xff):
+            pos = _index_cbor_item(data, pos, None if path is None else path + (index,), offsets)
+            index += 1
+        if arg is None:
+            pos += 1
+    elif major == 5:  # Maps
+        index = 0
+        while (index < arg) if arg is not None else (data[pos] != 0xff):
+            key_start = pos
+            pos = _index_cbor_item(data, pos, None, offsets)
+            key_path = None
+            if path is not None:
+                # Decode the key inside a one-entry map, so cbor2 turns array and map
+                # keys into tuples and frozendicts exactly as it did for cbor_data
+                key = next(iter(cbor_loads(b'\xa1' + data[key_start:pos] + b'\xf6')))
+                key_path = path + (key,)
+            pos = _index_cbor_item(data, pos, key_path, offsets)
+            index += 1
+        if arg is None:
+            pos += 1
+    elif major == 6:  # Tags cover the item they wrap
+        pos = _index_cbor_item(data, pos, path, offsets)
+    # Major types 0, 1 and 7 are fully described by their head
+
+    if path is not None:
+        offsets[path] = (start, pos - start)
+    return pos
+
+def index_cbor_offsets(dump_data):
+    """Map the key path of every item in the CBOR dump to its (start, length) in dump_data."""
+    offsets = {}
+    try:
+        _index_cbor_item(dump_data, 0, (), offsets)
+    except (IndexError, ValueError) as e:
+        print(f"Error indexing CBOR data: {e}")
+    return offsets
+
+# Maps printable ASCII bytes to themselves and everything else to '.'
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
 def hex_ascii_display(data):
-    hex_data = binascii.hexlify(data).decode('utf-8')
-    ascii_data = ''.join([chr(byte) if 32 <= byte < 127 else '.' for byte in data])
+    hex_data = memoryview(binascii.hexlify(data))
+    ascii_data = data.translate(_ASCII_TABLE).decode('latin1')
 
-    hex_dump = ""
-    ascii_dump = ""
+    hex_parts = []
 
     for i in range(0, len(hex_data), 32):
-        hex_chunk = hex_data[i:i + 32]
+        hex_chunk = str(hex_data[i:i + 32], 'ascii')
         ascii_chunk = ascii_data[i // 2:(i // 2) + (len(hex_chunk) // 2)]
-        hex_dump += f"{hex_chunk:32} {ascii_chunk}\n"
-        ascii_dump += ascii_chunk
+        hex_parts.append(f"{hex_chunk:32} {ascii_chunk}\n")
+
+    # The ASCII chunks laid end to end are just ascii_data, so it needs no joining
+    return ''.join(hex_parts), ascii_data
+
+def compute_hex_view(data):
+    """Build the text shown in the hex view for a save file."""
+    hex_dump, _ = hex_ascii_display(data)
+    return hex_dump
 
-    return hex_dump, ascii_dump
+def scan_for_images(data, images_out):
+    """Record the JPEGs embedded in each byte string of data, keyed by the id() of the byte string.
 
-def make_human_readable(data):
-    readable_data = []
+    The LazyImages keep their byte string alive, so its id() stays valid for
+    as long as images_out is in use.
+    """
     if isinstance(data, bytes):
+        # A JPEG runs from its SOI marker to the first EOI marker after it
+        images = []
         start = 0
         while True:
             start = data.find(b'\xff\xd8', start)
             if start == -1:
                 break
-            end = data.find(b'\xff\xd9', start) + 2
-            if end == 1:
+            end = data.find(b'\xff\xd9', start + 2)
+            if end == -1:
                 break
-            jpeg_data = data[start:end]
-            try:
-                image = Image.open(io.BytesIO(jpeg_data))
-                pixmap = pil_image_to_qt_pixmap(image)
-                readable_data.append(pixmap)
-            except Exception as e:
-                readable_data.append(f"Image could not be displayed: {e}")
-            start = end
-        if not readable_data:
-            readable_data = binascii.hexlify(data).decode('utf-8')
+            images.append(LazyImage(data, start, end + 2))
+            start = end + 2
+        if images:
+            images_out[id(data)] = images
     elif isinstance(data, list):
-        readable_data = [make_human_readable(item) for item in data]
+        for item in data:
+            scan_for_images(item, images_out)
     elif isinstance(data, dict):
-        readable_data = {make_human_readable(key): make_human_readable(value) for key, value in data.items()}
-    else:
-        readable_data = data
-    return readable_data
+        for value in data.values():
+            scan_for_images(value, images_out)
 
 def pil_image_to_qt_pixmap(image):
     if image.mode != "RGB":
         image = image.convert("RGB")
-    image_bytes = image.tobytes("raw", "RGB")
-    qimage = QImage(image_bytes, image.width, image.height, QImage.Format_RGB888)
+    image_bytes = image.tobytes()
+    # Pass the stride explicitly: PIL rows are packed, while QImage assumes
+    # 32-bit aligned rows unless told otherwise. QImage only wraps image_bytes,
+    # and fromImage makes the one copy the pixmap keeps.
+    qimage = QImage(image_bytes, image.width, image.height, image.width * 3, QImage.Format_RGB888)
     return QPixmap.fromImage(qimage)
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+import cbor2
+import pytest
+
+from read_bge20th_save import index_cbor_offsets
+
+
+def lookup(value, path):
+    for key in path:
+        if isinstance(value, cbor2.CBORTag):
+            value = value.value
+        value = value[key]
+    return value
+
+
+def check_offsets(dump, expected_paths):
+    offsets = index_cbor_offsets(dump)
+    assert set(offsets) == set(expected_paths)
+    decoded = cbor2.loads(dump)
+    for path, (start, length) in offsets.items():
+        assert cbor2.loads(dump[start:start + length]) == lookup(decoded, path)
+    start, length = offsets[()]
+    assert (start, length) == (0, len(dump))
+    return offsets
+
+
+@pytest.mark.parametrize("dump, expected_paths", [
+    # Definite array, map and strings
+    (cbor2.dumps([1, "text", b"\x00\x01", {"a": -5}]),
+     [(), (0,), (1,), (2,), (3,), (3, "a")]),
+    # Indefinite array holding an indefinite map
+    (bytes.fromhex("9f01bf6161f5ff02ff"),
+     [(), (0,), (1,), (1, "a"), (2,)]),
+    # Indefinite byte and text strings split into chunks
+    (bytes.fromhex("a2" "6162" "5f420102430304" "05ff" "6173" "7f61616162ff"),
+     [(), ("b",), ("s",)]),
+])
+def test_containers_and_strings(dump, expected_paths):
+    check_offsets(dump, expected_paths)
+
+
+def test_tags_cover_the_item_they_wrap():
+    dump = cbor2.dumps({"t": cbor2.CBORTag(4000, [1, 2]), "d": cbor2.CBORTag(4001, "x")})
+    offsets = check_offsets(dump, [(), ("t",), ("t", 0), ("t", 1), ("d",)])
+    start, length = offsets[("t",)]
+    assert dump[start] == 0xd9  # The span starts at the tag head, not the array
+
+
+def test_half_single_and_double_floats():
+    dump = bytes.fromhex("83" "f93e00" "fa3fc00000" "fb3ff8000000000000")
+    offsets = check_offsets(dump, [(), (0,), (1,), (2,)])
+    assert [offsets[(i,)][1] for i in range(3)] == [3, 5, 9]
+
+
+def test_non_string_keys():
+    dump = cbor2.dumps({5: "int", -2: [True], b"\x01": None, (1, 2): {"a": 5}})
+    check_offsets(dump, [(), (5,), (-2,), (-2, 0), (b"\x01",), ((1, 2),), ((1, 2), "a")])